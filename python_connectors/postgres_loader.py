@@ -6,19 +6,103 @@ Replaces Snowflake loader with PostgreSQL for unified data architecture.
 import os
 import json
 import logging
+import threading
 import psycopg
 from psycopg import rows
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes nested API payloads in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def to_json(value: Any) -> str:
+    """Serialize a dict/list value to a JSON string for storage"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    # default=str matches orjson for Decimal, set, datetime and other values
+    return json.dumps(value, default=str)
+
+# Loader connections stay open between syncs; TCP keepalives let idle
+# connections survive NAT/proxy timeouts and detect dead peers quickly.
+# application_name tags the sessions so the service's queries can be grouped
+# in pg_stat_activity, pg_stat_statements and the server logs
+CONNECTION_OPTIONS = {
+    "application_name": os.getenv("POSTGRES_APPLICATION_NAME", "saulto_connectors"),
+    "keepalives": 1,
+    "keepalives_idle": 60,
+    "keepalives_interval": 10,
+    "keepalives_count": 5,
+}
+
+# Connection pool shared by every loader in the process; without psycopg_pool
+# each loader keeps its own connection
+try:
+    from psycopg_pool import ConnectionPool
+    POOL_AVAILABLE = True
+except ImportError:
+    POOL_AVAILABLE = False
+
+POOL_MAX_SIZE = int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10"))
+
+_connection_pools: Dict[str, Any] = {}
+_connection_pools_lock = threading.Lock()
+
+def get_connection_pool(database_url: str):
+    """Get (or lazily open) the process-wide connection pool for a database"""
+    with _connection_pools_lock:
+        pool = _connection_pools.get(database_url)
+        if pool is None:
+            pool = ConnectionPool(
+                database_url,
+                min_size=1,
+                max_size=POOL_MAX_SIZE,
+                kwargs={"autocommit": True, **CONNECTION_OPTIONS},
+                name="postgres_loader",
+                open=True
+            )
+            _connection_pools[database_url] = pool
+            logger.info(f"Opened PostgreSQL connection pool (max {POOL_MAX_SIZE} connections)")
+        return pool
+
+# Characters replaced with underscores in column names, applied in one pass
+COLUMN_NAME_TRANSLATION = str.maketrans(' -.', '___')
+
+# PostgreSQL type for each exact Python value type
+POSTGRES_TYPES = {
+    type(None): "TEXT",
+    bool: "BOOLEAN",
+    int: "BIGINT",  # Use BIGINT for potentially large IDs
+    float: "NUMERIC",
+    datetime: "TIMESTAMP",
+    dict: "JSONB",
+    list: "JSONB",
+    str: "TEXT",
+}
+
 class PostgresLoader:
     """Helper class to load data into PostgreSQL analytics schemas"""
     
     def __init__(self):
         self.connection = None
+        # Connection borrowed from the pool by the current thread, if any
+        self.local = threading.local()
+        # Schemas already created/verified by this loader
+        self.verified_schemas = set()
+        # Source-key fingerprint of the last batch each table was prepared for
+        self.verified_tables: Dict[str, frozenset] = {}
         self.database_url = os.getenv("DATABASE_URL")
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable is required")
@@ -27,14 +111,36 @@ class PostgresLoader:
         """Get PostgreSQL connection"""
         if not self.connection or self.connection.closed:
             try:
-                self.connection = psycopg.connect(self.database_url, autocommit=True)
+                self.connection = psycopg.connect(self.database_url, autocommit=True, **CONNECTION_OPTIONS)
                 logger.info("Connected to PostgreSQL successfully")
             except Exception as e:
                 logger.error(f"Failed to connect to PostgreSQL: {e}")
                 raise
         return self.connection
     
-    def get_analytics_schema_name(self, company_id: int) -> str:
+    @contextmanager
+    def connection_scope(self):
+        """Borrow a pooled connection (or use this loader's own) for a unit of work"""
+        conn = getattr(self.local, "connection", None)
+        if conn is not None:
+            # Nested call within the same unit of work: reuse its connection
+            yield conn
+            return
+        
+        if not POOL_AVAILABLE:
+            yield self.get_connection()
+            return
+        
+        with get_connection_pool(self.database_url).connection() as conn:
+            self.local.connection = conn
+            try:
+                yield conn
+            finally:
+                self.local.connection = None
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_analytics_schema_name(company_id: int) -> str:
         """Get analytics schema name for company"""
         return f"analytics_company_{company_id}"
     
@@ -42,14 +148,13 @@ class PostgresLoader:
         """Create analytics schema for company if it doesn't exist"""
         try:
             schema_name = self.get_analytics_schema_name(company_id)
-            conn = self.get_connection()
+            if schema_name in self.verified_schemas:
+                return
             
-            with conn.cursor() as cursor:
-                # Create schema if not exists
-                cursor.execute(f"""
-                    CREATE SCHEMA IF NOT EXISTS {schema_name}
-                """)
-                logger.info(f"Created/verified analytics schema: {schema_name}")
+            # Create schema if not exists
+            # prepare_table marks the schema verified once the DDL has succeeded
+            self.execute_ddl(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+            logger.info(f"Created/verified analytics schema: {schema_name}")
                 
         except Exception as e:
             logger.error(f"Error creating analytics schema for company {company_id}: {e}")
@@ -57,25 +162,20 @@ class PostgresLoader:
     
     def clean_column_name(self, name: str) -> str:
         """Clean column name for PostgreSQL compatibility"""
-        return name.replace(' ', '_').replace('-', '_').replace('.', '_').lower()
+        return name.translate(COLUMN_NAME_TRANSLATION).lower()
     
     def get_postgres_type(self, value: Any) -> str:
         """Determine PostgreSQL data type from Python value"""
-        if value is None:
-            return "TEXT"
-        elif isinstance(value, bool):
-            return "BOOLEAN"
-        elif isinstance(value, int):
-            # Use BIGINT for potentially large IDs
-            return "BIGINT"
-        elif isinstance(value, float):
-            return "NUMERIC"
-        elif isinstance(value, datetime):
-            return "TIMESTAMP"
-        elif isinstance(value, (dict, list)):
-            return "JSONB"
-        else:
-            return "TEXT"
+        # Exact-type lookup covers plain API values
+        postgres_type = POSTGRES_TYPES.get(type(value))
+        if postgres_type is not None:
+            return postgres_type
+        
+        # Subclasses (IntEnum, OrderedDict, ...) use their nearest mapped base
+        for base in type(value).__mro__:
+            if base in POSTGRES_TYPES:
+                return POSTGRES_TYPES[base]
+        return "TEXT"
     
     def create_table_if_not_exists(self, table_name: str, data: List[Dict[str, Any]], company_id: int):
         """Create table in PostgreSQL analytics schema if it doesn't exist"""
@@ -83,40 +183,37 @@ class PostgresLoader:
             schema_name = self.get_analytics_schema_name(company_id)
             full_table_name = f"{schema_name}.{table_name.lower()}"
             
-            conn = self.get_connection()
+            # Collect all possible columns from all records
+            all_columns = {}
+            for record in data:
+                for key, value in record.items():
+                    clean_key = self.clean_column_name(key)
+                    if clean_key not in all_columns:
+                        # Use TEXT as default type for flexible data handling
+                        # This avoids integer overflow and data type mismatch issues
+                        all_columns[clean_key] = "TEXT"
             
-            with conn.cursor() as cursor:
-                # Collect all possible columns from all records
-                all_columns = {}
-                for record in data:
-                    for key, value in record.items():
-                        clean_key = self.clean_column_name(key)
-                        if clean_key not in all_columns:
-                            # Use TEXT as default type for flexible data handling
-                            # This avoids integer overflow and data type mismatch issues
-                            all_columns[clean_key] = "TEXT"
-                
-                # Generate column definitions 
-                columns = []
-                for clean_key in sorted(all_columns.keys()):
-                    col_type = all_columns[clean_key]
-                    columns.append(f"{clean_key} {col_type}")
-                
-                # Add metadata columns
-                columns.extend([
-                    "loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
-                    "source_system VARCHAR(100)",
-                    "company_id BIGINT"  # Use BIGINT to handle large company IDs
-                ])
-                
-                create_sql = f"""
-                    CREATE TABLE IF NOT EXISTS {full_table_name} (
-                        {', '.join(columns)}
-                    )
-                """
-                
-                cursor.execute(create_sql)
-                logger.info(f"Created/verified table {full_table_name} with {len(all_columns)} data columns")
+            # Generate column definitions 
+            columns = []
+            for clean_key in sorted(all_columns.keys()):
+                col_type = all_columns[clean_key]
+                columns.append(f"{clean_key} {col_type}")
+            
+            # Add metadata columns
+            columns.extend([
+                "loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+                "source_system VARCHAR(100)",
+                "company_id BIGINT"  # Use BIGINT to handle large company IDs
+            ])
+            
+            create_sql = f"""
+                CREATE TABLE IF NOT EXISTS {full_table_name} (
+                    {', '.join(columns)}
+                )
+            """
+            
+            self.execute_ddl(create_sql)
+            logger.info(f"Created/verified table {full_table_name} with {len(all_columns)} data columns")
                 
         except Exception as e:
             logger.error(f"Error creating table {table_name}: {e}")
@@ -126,8 +223,10 @@ class PostgresLoader:
         """Prepare value for PostgreSQL insertion"""
         if value is None:
             return None
+        elif type(value) is str:
+            return value  # Most API fields are already text
         elif isinstance(value, (dict, list)):
-            return json.dumps(value)  # Store complex objects as JSON
+            return to_json(value)  # Store complex objects as JSON
         elif isinstance(value, bool):
             return str(value).lower()  # Convert to string for TEXT columns
         elif isinstance(value, (int, float)):
@@ -138,6 +237,40 @@ class PostgresLoader:
         else:
             return str(value)
     
+    def prepare_table(self, table_name: str, data: List[Dict[str, Any]], company_id: int):
+        """Ensure the analytics schema and target table exist"""
+        schema_name = self.get_analytics_schema_name(company_id)
+        full_table_name = f"{schema_name}.{table_name.lower()}"
+        # Batches with the same keys as the last prepared one need no DDL
+        fingerprint = frozenset().union(*data)
+        if schema_name in self.verified_schemas and self.verified_tables.get(full_table_name) == fingerprint:
+            return
+        
+        with self.connection_scope() as conn:
+            # Send the schema and table DDL in pipeline mode so both statements
+            # share one network round trip (falls back when libpq lacks support)
+            with conn.pipeline() if psycopg.Pipeline.is_supported() else nullcontext():
+                # Ensure analytics schema exists
+                self.ensure_analytics_schema(company_id)
+                
+                # Create table if needed
+                self.create_table_if_not_exists(table_name, data, company_id)
+        
+        # Pipelined statements only report errors when the pipeline syncs, so
+        # record verification after the block has exited cleanly
+        self.verified_schemas.add(schema_name)
+        self.verified_tables[full_table_name] = fingerprint
+    
+    def copy_rows(self, full_table_name: str, columns: List[str], values_list: List[tuple]):
+        """Stream prepared rows into a table with COPY"""
+        with self.connection_scope() as conn, conn.cursor() as cursor:
+            column_names = ', '.join(columns)
+            
+            # Stream all rows with COPY instead of one INSERT per row
+            with cursor.copy(f"COPY {full_table_name} ({column_names}) FROM STDIN") as copy:
+                for row in values_list:
+                    copy.write_row(row)
+    
     def load_data(self, table_name: str, data: List[Dict[str, Any]], 
                   source_system: str, company_id: int) -> int:
         """Load data into PostgreSQL analytics table"""
@@ -146,71 +279,59 @@ class PostgresLoader:
             return 0
             
         try:
-            # Ensure analytics schema exists
-            self.ensure_analytics_schema(company_id)
-            
-            # Create table if needed
-            self.create_table_if_not_exists(table_name, data, company_id)
-            
             schema_name = self.get_analytics_schema_name(company_id)
             full_table_name = f"{schema_name}.{table_name.lower()}"
             
-            conn = self.get_connection()
-            
-            # Prepare data for insertion
-            insert_data = []
-            
-            # First pass: collect all possible column names
-            all_columns = set()
+            # First pass: collect all possible column names, cleaning each
+            # distinct source key only once
+            clean_keys = {}
             for record in data:
                 for key in record.keys():
-                    clean_key = self.clean_column_name(key)
-                    all_columns.add(clean_key)
+                    if key not in clean_keys:
+                        clean_keys[key] = self.clean_column_name(key)
             
             # Add metadata columns
+            all_columns = set(clean_keys.values())
             all_columns.update(['loaded_at', 'source_system', 'company_id'])
             columns = sorted(list(all_columns))  # Sort for consistency
+            column_index = {col: i for i, col in enumerate(columns)}
+            # Resolve each source key straight to its position in the row
+            key_index = {key: column_index[clean_key] for key, clean_key in clean_keys.items()}
+            loaded_at_index = column_index['loaded_at']
+            source_system_index = column_index['source_system']
+            company_id_index = column_index['company_id']
             
-            # Second pass: prepare records with all columns
+            # Second pass: convert each record straight into a value tuple in
+            # column order (no intermediate per-row dict)
+            loaded_at = datetime.utcnow()  # One load timestamp per batch
+            values_list = []
             for record in data:
-                row_data = {}
-                
-                # Initialize all columns with None
-                for col in columns:
-                    row_data[col] = None
+                row = [None] * len(columns)
                 
                 # Fill in actual values
                 for key, value in record.items():
-                    clean_key = self.clean_column_name(key)
-                    row_data[clean_key] = self.prepare_value_for_insert(value)
+                    row[key_index[key]] = self.prepare_value_for_insert(value)
                 
                 # Add metadata
-                row_data['loaded_at'] = datetime.utcnow()
-                row_data['source_system'] = source_system
-                row_data['company_id'] = company_id
+                row[loaded_at_index] = loaded_at
+                row[source_system_index] = source_system
+                row[company_id_index] = company_id
                 
-                insert_data.append(row_data)
+                values_list.append(tuple(row))
             
-            if insert_data:
-                with conn.cursor() as cursor:
-                    # Build the INSERT statement
-                    column_names = ', '.join(columns)
-                    placeholders = ', '.join(['%s'] * len(columns))
-                    
-                    # Prepare values as tuples, ensuring all rows have same structure
-                    values_list = []
-                    for row in insert_data:
-                        values_list.append(tuple(row.get(col) for col in columns))
-                    
-                    # Execute batch insert using executemany for better performance
-                    cursor.executemany(
-                        f"INSERT INTO {full_table_name} ({column_names}) VALUES ({placeholders})",
-                        values_list
-                    )
-                    
-                    logger.info(f"Loaded {len(values_list)} records into {full_table_name}")
-                    
-                    return len(values_list)
+            try:
+                self.prepare_table(table_name, data, company_id)
+                self.copy_rows(full_table_name, columns, values_list)
+            except (psycopg.errors.InvalidSchemaName, psycopg.errors.UndefinedTable):
+                # Schema or table was dropped since we verified it; recreate it once
+                self.verified_schemas.discard(schema_name)
+                self.verified_tables.pop(full_table_name, None)
+                self.prepare_table(table_name, data, company_id)
+                self.copy_rows(full_table_name, columns, values_list)
+            
+            logger.info(f"Loaded {len(values_list)} records into {full_table_name}")
+            
+            return len(values_list)
                 
         except Exception as e:
             logger.error(f"Error loading data into {table_name}: {e}")
@@ -219,15 +340,12 @@ class PostgresLoader:
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """Execute a query and return results as list of dictionaries"""
         try:
-            conn = self.get_connection()
-            
-            with conn.cursor(row_factory=rows.dict_row) as cursor:
+            with self.connection_scope() as conn, conn.cursor(row_factory=rows.dict_row) as cursor:
                 cursor.execute(query, params)
                 
                 if cursor.description:
-                    # Query returned results
-                    results = cursor.fetchall()
-                    return [dict(row) for row in results]
+                    # Query returned results (dict_row already yields dicts)
+                    return cursor.fetchall()
                 else:
                     # Query didn't return results (INSERT, UPDATE, DELETE, etc.)
                     return []
@@ -237,6 +355,17 @@ class PostgresLoader:
             logger.error(f"Query: {query}")
             raise
     
+    def execute_ddl(self, sql: str):
+        """Execute a DDL statement without fetching or building result rows"""
+        try:
+            with self.connection_scope() as conn:
+                conn.execute(sql)
+            
+        except Exception as e:
+            logger.error(f"Error executing DDL: {e}")
+            logger.error(f"Query: {sql}")
+            raise
+    
     def get_table_info(self, company_id: int) -> List[Dict[str, Any]]:
         """Get information about tables in the analytics schema"""
         try:
@@ -264,15 +393,22 @@ class PostgresLoader:
         try:
             schema_name = self.get_analytics_schema_name(company_id)
             
+            # Read pg_catalog scoped to the one namespace rather than the
+            # information_schema.tables view, which privilege-checks every
+            # relation in the database before filtering by schema
             query = """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = %s
-                ORDER BY table_name
+                SELECT c.relname
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s
+                AND c.relkind IN ('r', 'p', 'v', 'f')
+                ORDER BY c.relname
             """
             
-            results = self.execute_query(query, (schema_name,))
-            return [row['table_name'] for row in results]
+            # Single-column result: read plain tuple rows instead of dicts
+            with self.connection_scope() as conn, conn.cursor() as cursor:
+                cursor.execute(query, (schema_name,))
+                return [table_name for (table_name,) in cursor]
             
         except Exception as e:
             logger.error(f"Error getting table list for company {company_id}: {e}")
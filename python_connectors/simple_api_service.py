@@ -6,6 +6,7 @@ This service runs on port 5002 and provides HTTP endpoints for connector managem
 from flask import Flask, request, jsonify
 import logging
 import json
+import re
 from datetime import datetime
 from .simple_connector_manager import simple_connector_manager
 
@@ -13,8 +14,39 @@ from .simple_connector_manager import simple_connector_manager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Response compression is optional; tabular JSON shrinks 5-10x with gzip/br
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    logger.info("flask-compress not available - responses will not be compressed")
+
 app = Flask(__name__)
 
+# Only compress payloads worth the CPU; level 4 keeps latency low
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 4
+if COMPRESS_AVAILABLE:
+    Compress(app)
+
+# Table names end up in PostgreSQL identifiers, so only allow plain names
+TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_]{1,64}$')
+MAX_SYNC_TABLES = 100
+
+@app.before_request
+def validate_connector_type():
+    """Reject unknown connector types before any connector or database lookup"""
+    connector_type = (request.view_args or {}).get('connector_type')
+    if connector_type is not None and connector_type not in simple_connector_manager.CONNECTOR_REGISTRY:
+        # Keep the status endpoint's existing "not found" contract
+        if request.endpoint == 'get_connector_status':
+            return jsonify({"exists": False, "status": "not_found"})
+        return jsonify({
+            "success": False,
+            "error": f"Unknown connector type: {connector_type}"
+        }), 404
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -49,7 +81,12 @@ def get_available_connectors():
 def create_connector():
     """Create a new connector"""
     try:
-        data = request.json
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({
+                "success": False,
+                "error": "Request body must be a JSON object"
+            }), 400
         
         # Validate required fields
         required_fields = ['company_id', 'connector_type', 'credentials']
@@ -60,6 +97,12 @@ def create_connector():
                     "error": f"Missing required field: {field}"
                 }), 400
         
+        if not isinstance(data['credentials'], dict):
+            return jsonify({
+                "success": False,
+                "error": "credentials must be an object"
+            }), 400
+        
         company_id = data['company_id']
         connector_type = data['connector_type']
         credentials = data['credentials']
@@ -134,9 +177,18 @@ def get_connector_tables(company_id, connector_type):
 def sync_connector(company_id, connector_type):
     """Sync data for a connector"""
     try:
-        data = request.json or {}
+        data = request.get_json(silent=True) or {}
         tables = data.get('tables')  # Optional: specific tables to sync
         
+        # Validate the table list before loading the connector or touching the database
+        if tables is not None:
+            if (not isinstance(tables, list) or len(tables) > MAX_SYNC_TABLES or
+                    not all(isinstance(t, str) and TABLE_NAME_PATTERN.match(t) for t in tables)):
+                return jsonify({
+                    "success": False,
+                    "error": f"tables must be a list of at most {MAX_SYNC_TABLES} valid table names"
+                }), 400
+        
         result = simple_connector_manager.sync_connector(company_id, connector_type, tables)
         
         return jsonify({
@@ -5,6 +5,8 @@ This version uses basic Python data structures instead of pandas DataFrames.
 
 import logging
 import json
+import threading
+import requests
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -53,9 +55,22 @@ class SimpleBaseConnector(ABC):
         self.credentials = credentials
         self.config = config or {}
         
+        # HTTP sessions per calling thread (see the session property)
+        self.local = threading.local()
+        
         # Initialize PostgreSQL loader if available
         self.postgres_loader = PostgresLoader() if POSTGRES_AVAILABLE else None
         
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread, keeping its API connections alive"""
+        # Cached connectors serve concurrent request threads, and
+        # requests.Session is not thread-safe, so each thread gets its own
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = self.local.session = requests.Session()
+        return session
+    
     @property
     @abstractmethod
     def connector_name(self) -> str:
@@ -3,10 +3,14 @@ Simplified connector manager without pandas dependency.
 """
 
 import logging
+from contextlib import closing
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Type
 from datetime import datetime
 import json
 import os
+import time
 import psycopg2
 from .simple_base_connector import SimpleBaseConnector, SyncResult
 from .simple_salesforce_connector import SimpleSalesforceConnector
@@ -25,8 +29,21 @@ class SimpleConnectorManager:
         "odoo": SimpleOdooConnector,
     }
     
+    # Upper bound on connectors synced concurrently by sync_all_connectors
+    MAX_SYNC_WORKERS = int(os.getenv("CONNECTOR_SYNC_WORKERS", "4"))
+    
+    # Seconds a status check's connection test result is reused (0 disables)
+    STATUS_CHECK_TTL = float(os.getenv("CONNECTOR_STATUS_TTL", "60"))
+    
+    # Tags credential lookups in pg_stat_activity alongside the loader's sessions
+    APPLICATION_NAME = os.getenv("POSTGRES_APPLICATION_NAME", "saulto_connectors")
+    
     def __init__(self):
         self.active_connectors: Dict[str, SimpleBaseConnector] = {}
+        # connector_key -> (connector, checked_at, connection_ok, message)
+        self.status_checks: Dict[str, tuple] = {}
+        # Read once; the service environment does not change while running
+        self.database_url = os.getenv('DATABASE_URL')
     
     @classmethod
     def get_available_connectors(cls) -> List[str]:
@@ -34,8 +51,9 @@ class SimpleConnectorManager:
         return list(cls.CONNECTOR_REGISTRY.keys())
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_connector_requirements(cls, connector_type: str) -> Dict[str, Any]:
-        """Get requirements for a specific connector type"""
+        """Get requirements for a specific connector type (built once per type)"""
         if connector_type not in cls.CONNECTOR_REGISTRY:
             return {}
         
@@ -109,24 +127,21 @@ class SimpleConnectorManager:
     def _load_credentials_from_database(self, company_id: int, connector_type: str) -> Optional[Dict[str, Any]]:
         """Load connector credentials from PostgreSQL database"""
         try:
-            database_url = os.getenv('DATABASE_URL')
-            if not database_url:
+            if not self.database_url:
                 logger.error("DATABASE_URL not found in environment")
                 return None
             
-            conn = psycopg2.connect(database_url)
-            cur = conn.cursor()
-            
-            # Query data_sources table for this company and connector type
-            cur.execute("""
-                SELECT credentials 
-                FROM data_sources 
-                WHERE company_id = %s AND type = %s 
-                AND credentials IS NOT NULL
-            """, (company_id, connector_type))
-            
-            result = cur.fetchone()
-            conn.close()
+            # closing() guarantees the connection is released even if the query fails
+            with closing(psycopg2.connect(self.database_url, application_name=self.APPLICATION_NAME)) as conn, conn.cursor() as cur:
+                # Query data_sources table for this company and connector type
+                cur.execute("""
+                    SELECT credentials 
+                    FROM data_sources 
+                    WHERE company_id = %s AND type = %s 
+                    AND credentials IS NOT NULL
+                """, (company_id, connector_type))
+                
+                result = cur.fetchone()
             
             if result and result[0]:
                 logger.info(f"✅ Found {connector_type} credentials in database for company {company_id}")
@@ -225,10 +240,19 @@ class SimpleConnectorManager:
             if key.startswith(f"{company_id}_")
         ]
         
-        for connector_key in company_connectors:
-            connector_type = connector_key.split("_", 1)[1]
-            result = self.sync_connector(company_id, connector_type)
-            results[connector_type] = result
+        connector_types = [key.split("_", 1)[1] for key in company_connectors]
+        if not connector_types:
+            return results
+        
+        # Syncs are I/O bound and each connector has its own API session and
+        # PostgreSQL connection, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(connector_types), self.MAX_SYNC_WORKERS)) as executor:
+            futures = {
+                connector_type: executor.submit(self.sync_connector, company_id, connector_type)
+                for connector_type in connector_types
+            }
+            for connector_type, future in futures.items():
+                results[connector_type] = future.result()
         
         return results
     
@@ -238,6 +262,7 @@ class SimpleConnectorManager:
             connector_key = f"{company_id}_{connector_type}"
             if connector_key in self.active_connectors:
                 del self.active_connectors[connector_key]
+                self.status_checks.pop(connector_key, None)
                 logger.info(f"Removed {connector_type} connector for company {company_id}")
                 return True
             
@@ -247,6 +272,22 @@ class SimpleConnectorManager:
             logger.error(f"Failed to remove connector: {str(e)}")
             return False
     
+    def _check_connection(self, connector_key: str, connector: SimpleBaseConnector) -> tuple[bool, str]:
+        """Test a connector's connection, reusing a recent result for the same instance"""
+        cached = self.status_checks.get(connector_key)
+        # A recreated or reloaded connector is a new instance, so it is always re-tested
+        if cached and cached[0] is connector and time.monotonic() - cached[1] < self.STATUS_CHECK_TTL:
+            return cached[2], cached[3]
+        
+        try:
+            connection_ok = connector.test_connection()
+            message = "Connection test successful" if connection_ok else "Connection test failed"
+        except Exception as e:
+            connection_ok, message = False, f"Connection test error: {str(e)}"
+        
+        self.status_checks[connector_key] = (connector, time.monotonic(), connection_ok, message)
+        return connection_ok, message
+    
     def get_connector_status(self, company_id: int, connector_type: str) -> Dict[str, Any]:
         """Get status information for a connector"""
         try:
@@ -257,19 +298,22 @@ class SimpleConnectorManager:
                     "status": "not_found"
                 }
             
-            # Test connection
-            connection_ok, message = self.test_connector(company_id, connector_type)
+            # Test connection (reuse the connector looked up above)
+            connection_ok, message = self._check_connection(f"{company_id}_{connector_type}", connector)
             
             # Get table count
-            success, tables, _ = self.get_connector_tables(company_id, connector_type)
-            table_count = len(tables) if success else 0
+            try:
+                tables = connector.get_available_tables()
+            except Exception as e:
+                logger.error(f"Failed to get tables: {str(e)}")
+                tables = []
             
             return {
                 "exists": True,
                 "status": "connected" if connection_ok else "error",
                 "message": message,
-                "table_count": table_count,
-                "available_tables": tables if success else []
+                "table_count": len(tables),
+                "available_tables": tables
             }
             
         except Exception as e:
@@ -2,11 +2,12 @@
 Simplified Jira API connector without pandas dependency.
 """
 
-import requests
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import base64
+import os
 from .simple_base_connector import SimpleBaseConnector
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class SimpleJiraConnector(SimpleBaseConnector):
     """Simplified Jira API connector using REST API v3"""
     
+    # Pages fetched concurrently once the first page reports the result total
+    PAGE_FETCH_WORKERS = int(os.getenv("JIRA_PAGE_FETCH_WORKERS", "4"))
+    
     @property
     def connector_name(self) -> str:
         return "jira"
@@ -71,7 +75,7 @@ class SimpleJiraConnector(SimpleBaseConnector):
         """Test Jira connection"""
         try:
             url = f"{self.server_url}/rest/api/3/myself"
-            response = requests.get(url, headers=self.get_headers(), timeout=10)
+            response = self.session.get(url, headers=self.get_headers(), timeout=10)
             response.raise_for_status()
             
             logger.info("Jira connection test successful")
@@ -86,57 +90,80 @@ class SimpleJiraConnector(SimpleBaseConnector):
         # For Jira, we return our predefined objects since they're standard
         return self.default_objects
     
+    def _fetch_page(self, url: str, params: Dict[str, Any], start_at: int, max_results: int) -> tuple[List[Dict], int]:
+        """Fetch one page of a Jira listing and return (results, total)"""
+        request_params = {
+            **params,
+            'startAt': start_at,
+            'maxResults': max_results
+        }
+        
+        response = self.session.get(url, headers=self.get_headers(), params=request_params, timeout=30)
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        # Handle different response formats
+        if 'issues' in data:
+            # Issues endpoint
+            results = data['issues']
+            total = data.get('total', 0)
+        elif 'values' in data:
+            # Agile endpoints (boards, sprints)
+            results = data['values']
+            total = data.get('total', len(results))
+        else:
+            # Direct array response (projects, users, etc.)
+            results = data if isinstance(data, list) else [data]
+            total = len(results)
+        
+        return results, total
+    
     def make_paginated_request(self, url: str, params: Dict[str, Any] = None) -> List[Dict]:
         """Make paginated requests to Jira API"""
         all_results = []
-        start_at = 0
         max_results = 50  # Smaller batch size for reliability
         
         if params is None:
             params = {}
         
         max_pages = 10  # Limit to prevent issues
-        page_count = 0
         
-        while page_count < max_pages:
-            request_params = {
-                **params,
-                'startAt': start_at,
-                'maxResults': max_results
-            }
-            
-            try:
-                response = requests.get(url, headers=self.get_headers(), params=request_params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Handle different response formats
-                if 'issues' in data:
-                    # Issues endpoint
-                    results = data['issues']
-                    total = data.get('total', 0)
-                elif 'values' in data:
-                    # Agile endpoints (boards, sprints)
-                    results = data['values']
-                    total = data.get('total', len(results))
-                else:
-                    # Direct array response (projects, users, etc.)
-                    results = data if isinstance(data, list) else [data]
-                    total = len(results)
+        try:
+            results, total = self._fetch_page(url, params, 0, max_results)
+        except Exception as e:
+            logger.error(f"Error making paginated request to {url}: {str(e)}")
+            return all_results
+        
+        all_results.extend(results)
+        
+        # Check if we have more pages
+        if len(results) < max_results or len(all_results) >= total:
+            return all_results
+        
+        # The first page's total fixes every remaining offset, so prefetch the
+        # rest concurrently (each worker thread uses its own session) and
+        # consume them in order
+        offsets = range(max_results, min(total, max_pages * max_results), max_results)
+        with ThreadPoolExecutor(max_workers=self.PAGE_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self._fetch_page, url, params, start_at, max_results)
+                for start_at in offsets
+            ]
+            for future in futures:
+                try:
+                    results, _ = future.result()
+                except Exception as e:
+                    logger.error(f"Error making paginated request to {url}: {str(e)}")
+                    break
                 
                 all_results.extend(results)
                 
-                # Check if we have more pages
                 if len(results) < max_results or len(all_results) >= total:
                     break
-                
-                start_at += max_results
-                page_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error making paginated request to {url}: {str(e)}")
-                break
+            
+            for future in futures:
+                future.cancel()
         
         return all_results
     
@@ -262,7 +289,7 @@ class SimpleJiraConnector(SimpleBaseConnector):
             
             # Some endpoints don't support pagination
             if object_name in ['statuses', 'priorities', 'issue_types']:
-                response = requests.get(url, headers=self.get_headers(), timeout=30)
+                response = self.session.get(url, headers=self.get_headers(), timeout=30)
                 response.raise_for_status()
                 results = response.json()
                 if not isinstance(results, list):
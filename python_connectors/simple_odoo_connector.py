@@ -5,6 +5,7 @@ Supports extracting ERP data for business metrics and analytics.
 
 import xmlrpc.client
 import logging
+import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import json
@@ -13,6 +14,21 @@ from .simple_base_connector import SimpleBaseConnector
 
 logger = logging.getLogger(__name__)
 
+class TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport whose HTTP connections give up after a socket timeout"""
+    
+    def __init__(self, timeout: float, **kwargs):
+        super().__init__(**kwargs)
+        self.timeout = timeout
+    
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+class TimeoutSafeTransport(TimeoutTransport, xmlrpc.client.SafeTransport):
+    """HTTPS variant of TimeoutTransport"""
+
 class SimpleOdooConnector(SimpleBaseConnector):
     """
     Connector for Odoo ERP system using XML-RPC API key authentication.
@@ -21,6 +37,9 @@ class SimpleOdooConnector(SimpleBaseConnector):
     access ERP data for analytics purposes.
     """
     
+    # Seconds an XML-RPC call waits on the Odoo server before failing
+    XMLRPC_TIMEOUT = float(os.getenv("ODOO_XMLRPC_TIMEOUT", "60"))
+    
     def _normalize_url(self, url: str) -> str:
         """Normalize URL to ensure proper protocol and format"""
         normalized = url.strip()
@@ -43,6 +62,10 @@ class SimpleOdooConnector(SimpleBaseConnector):
         raw_url = credentials.get('odoo_instance_url', '')
         self.base_url = self._normalize_url(raw_url) if raw_url else ''
         
+        # XML-RPC endpoints are fixed once the instance URL is known
+        self.common_url = f'{self.base_url}/xmlrpc/2/common'
+        self.object_url = f'{self.base_url}/xmlrpc/2/object'
+        
         # Database name
         self.database = credentials.get('database', '')
         
@@ -50,14 +73,10 @@ class SimpleOdooConnector(SimpleBaseConnector):
         self.username = credentials.get('username', '')
         self.api_key = credentials.get('api_key', '')
         
-        # Setup authentication headers
-        if self.access_token:
-            self.session.headers.update({
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            })
-    
+        # XML-RPC clients and user ID are set up lazily on first use
+        self.common_client = None
+        self.object_client = None
+        self.uid = None
     
     @property
     def connector_name(self) -> str:
@@ -67,15 +86,18 @@ class SimpleOdooConnector(SimpleBaseConnector):
         """Setup XML-RPC clients for common and object endpoints"""
         if self.base_url:
             try:
-                # Normalize URL to ensure proper protocol
-                normalized_url = self._normalize_url(self.base_url)
-                logger.info(f"Setting up XML-RPC clients for: {normalized_url}")
+                logger.info(f"Setting up XML-RPC clients for: {self.base_url}")
                 
-                self.common_client = xmlrpc.client.ServerProxy(f'{normalized_url}/xmlrpc/2/common')
-                self.object_client = xmlrpc.client.ServerProxy(f'{normalized_url}/xmlrpc/2/object')
+                self.common_client = self._new_server_proxy(self.common_url)
+                self.object_client = self._new_server_proxy(self.object_url)
             except Exception as e:
                 logger.error(f"Failed to setup XML-RPC clients: {e}")
 
+    def _new_server_proxy(self, url: str) -> xmlrpc.client.ServerProxy:
+        """Create an XML-RPC client whose calls time out instead of hanging"""
+        transport_class = TimeoutSafeTransport if url.startswith('https://') else TimeoutTransport
+        return xmlrpc.client.ServerProxy(url, transport=transport_class(self.XMLRPC_TIMEOUT))
+
     @property
     def required_credentials(self) -> List[str]:
         """Required credentials for Odoo API key connector"""
@@ -259,6 +281,7 @@ class SimpleOdooConnector(SimpleBaseConnector):
             )
             
             # Process records to handle Odoo's many2one fields
+            extracted_at = datetime.utcnow().isoformat()
             processed_records = []
             for record in records:
                 processed = {}
@@ -271,7 +294,7 @@ class SimpleOdooConnector(SimpleBaseConnector):
                         processed[key] = value
                         
                 # Add metadata
-                processed['_extracted_at'] = datetime.utcnow().isoformat()
+                processed['_extracted_at'] = extracted_at
                 processed['_source'] = 'odoo'
                 processed['_company_id'] = self.company_id
                 
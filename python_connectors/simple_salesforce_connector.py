@@ -2,15 +2,36 @@
 Simplified Salesforce API connector without pandas dependency.
 """
 
-import requests
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
+import os
 import urllib.parse
+import time
 from .simple_base_connector import SimpleBaseConnector
 
 logger = logging.getLogger(__name__)
 
+# PyJWT (with cryptography) enables the key-pair JWT bearer flow
+try:
+    import jwt
+    from jwt.algorithms import RSAAlgorithm
+    JWT_AVAILABLE = True
+except ImportError:
+    JWT_AVAILABLE = False
+    logger.debug("PyJWT not available - Salesforce JWT bearer flow disabled")
+
+# Server-managed directory of JWT private keys, one company_<id>.pem per company.
+# Key files are never taken from tenant-supplied credentials.
+SALESFORCE_JWT_KEY_DIR = os.getenv("SALESFORCE_JWT_KEY_DIR")
+
+def get_key_file_path(company_id: int) -> Optional[str]:
+    """Path of a company's JWT private key in the server key directory, if present"""
+    if not SALESFORCE_JWT_KEY_DIR:
+        return None
+    path = os.path.join(SALESFORCE_JWT_KEY_DIR, f"company_{int(company_id)}.pem")
+    return path if os.path.isfile(path) else None
+
 class SimpleSalesforceConnector(SimpleBaseConnector):
     """Simplified Salesforce API connector using REST API v59.0"""
     
@@ -20,9 +41,26 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
     
     @property
     def required_credentials(self) -> List[str]:
+        if self.uses_jwt_bearer:
+            return ["client_id", "username", "instance_url"]
         return ["client_id", "client_secret", "username", "password", "security_token", "instance_url"]
     
+    @property
+    def uses_jwt_bearer(self) -> bool:
+        """Whether key-pair (JWT bearer) authentication is configured"""
+        return bool(self.private_key or self.private_key_path)
+    
     def __init__(self, company_id: int, credentials: Dict[str, Any], config: Dict[str, Any] = None):
+        # Key-pair auth: inline PEM private key contents, or this company's key
+        # file in the server-managed key directory
+        self.private_key = credentials.get("private_key")
+        self.private_key_path = get_key_file_path(company_id)
+        if credentials.get("private_key_path"):
+            logger.warning("Ignoring private_key_path in Salesforce credentials; "
+                           "provide private_key or a key file in SALESFORCE_JWT_KEY_DIR")
+        self._signing_key = None
+        self.login_url = credentials.get("login_url", "https://login.salesforce.com").rstrip('/')
+        
         super().__init__(company_id, credentials, config)
         self.client_id = credentials.get("client_id")
         self.client_secret = credentials.get("client_secret")
@@ -82,7 +120,10 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
         }
     
     def authenticate(self) -> bool:
-        """Authenticate with Salesforce using OAuth 2.0 Username-Password flow"""
+        """Authenticate with Salesforce (JWT bearer flow when a private key is configured)"""
+        if self.uses_jwt_bearer:
+            return self.authenticate_jwt()
+        
         try:
             # OAuth token endpoint
             token_url = f"{self.instance_url}/services/oauth2/token"
@@ -96,7 +137,7 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
                 'password': self.password + self.security_token  # Concatenate password with security token
             }
             
-            response = requests.post(token_url, data=params, timeout=30)
+            response = self.session.post(token_url, data=params, timeout=30)
             response.raise_for_status()
             
             token_data = response.json()
@@ -115,6 +156,58 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
             self.access_token = None
             return False
     
+    def get_signing_key(self):
+        """Load and parse the JWT private key once (PEM parsing dominates RS256 signing time)"""
+        if self._signing_key is None:
+            if self.private_key:
+                private_key = self.private_key
+            else:
+                with open(self.private_key_path, 'r') as key_file:
+                    private_key = key_file.read()
+            
+            self._signing_key = RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(private_key)
+        
+        return self._signing_key
+    
+    def authenticate_jwt(self) -> bool:
+        """Authenticate with Salesforce using the OAuth 2.0 JWT Bearer flow (no password or MFA)"""
+        try:
+            if not JWT_AVAILABLE:
+                raise ValueError("PyJWT[crypto] is required for Salesforce key-pair authentication")
+            
+            claims = {
+                'iss': self.client_id,
+                'sub': self.username,
+                'aud': self.login_url,
+                'exp': int(time.time()) + 180
+            }
+            assertion = jwt.encode(claims, self.get_signing_key(), algorithm='RS256')
+            
+            response = self.session.post(
+                f"{self.login_url}/services/oauth2/token",
+                data={
+                    'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+                    'assertion': assertion
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+            
+            token_data = response.json()
+            self.access_token = token_data['access_token']
+            self.token_type = token_data.get('token_type', 'Bearer')
+            
+            if 'instance_url' in token_data:
+                self.instance_url = token_data['instance_url']
+            
+            logger.info("Salesforce JWT bearer authentication successful")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Salesforce JWT bearer authentication failed: {str(e)}")
+            self.access_token = None
+            return False
+    
     def get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
         if not self.access_token:
@@ -137,7 +230,7 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
             url = f"{self.instance_url}/services/data/{self.api_version}/query"
             params = {'q': 'SELECT Id, Name FROM Organization LIMIT 1'}
             
-            response = requests.get(url, headers=self.get_headers(), params=params, timeout=10)
+            response = self.session.get(url, headers=self.get_headers(), params=params, timeout=10)
             response.raise_for_status()
             
             logger.info("Salesforce connection test successful")
@@ -169,10 +262,10 @@ class SimpleSalesforceConnector(SimpleBaseConnector):
             while url and records_retrieved < max_records:
                 if url.startswith('http'):
                     # Full URL for subsequent requests
-                    response = requests.get(url, headers=self.get_headers(), timeout=30)
+                    response = self.session.get(url, headers=self.get_headers(), timeout=30)
                 else:
                     # Relative URL - construct full URL
-                    response = requests.get(f"{self.instance_url}{url}", headers=self.get_headers(), timeout=30)
+                    response = self.session.get(f"{self.instance_url}{url}", headers=self.get_headers(), timeout=30)
                 
                 if response.status_code == 401:
                     # Token expired, re-authenticate
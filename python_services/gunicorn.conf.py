@@ -0,0 +1,40 @@
+"""
+Gunicorn configuration for the Python Connector API service.
+Serves python_connectors.simple_api_service:app on port 5002 with threaded workers.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('CONNECTOR_SERVICE_PORT', '5002')}"
+
+# Connector calls are I/O bound (SaaS APIs + PostgreSQL), so threads give the
+# request parallelism. The connector registry and status cache live in process
+# memory, so a single worker keeps sync-all, delete and re-create consistent;
+# only raise CONNECTOR_SERVICE_WORKERS once that state is shared.
+worker_class = "gthread"
+workers = int(os.getenv("CONNECTOR_SERVICE_WORKERS", "1"))
+threads = int(os.getenv("CONNECTOR_SERVICE_THREADS", "8"))
+
+# Import the app (Flask, requests, psycopg and all connectors) once in the
+# master so workers fork with a warm import cache and share those pages.
+preload_app = True
+
+# Full syncs can run for a long time; 0 disables the worker timeout so they
+# are never killed mid-sync (matching the Flask development server)
+timeout = int(os.getenv("CONNECTOR_SERVICE_TIMEOUT", "0"))
+graceful_timeout = 30
+
+accesslog = "-"
+errorlog = "-"
+loglevel = "info"
+
+
+def post_fork(server, worker):
+    """Start each worker with its own connector registry and DB connections"""
+    from python_connectors.simple_connector_manager import simple_connector_manager
+
+    # Connections must never be shared across processes; the master does not
+    # serve requests, so anything registered before the fork is discarded.
+    simple_connector_manager.active_connectors.clear()
+    simple_connector_manager.status_checks.clear()
+    server.log.info(f"Connector worker {worker.pid} ready")
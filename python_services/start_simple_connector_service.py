@@ -2,23 +2,44 @@
 """
 Start the simplified Python Connector API service without pandas dependency.
 This script starts the Flask API on port 5002 for managing data connectors.
+The service runs under gunicorn (threaded workers) when it is installed and
+falls back to the Flask development server otherwise (e.g. on Windows).
 """
 
 import sys
 import os
+import importlib.util
 
 # Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
 
-# Import and run the simplified API service
-from python_connectors.simple_api_service import app
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+GUNICORN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gunicorn.conf.py")
+APP_MODULE = "python_connectors.simple_api_service:app"
+
+def run_gunicorn():
+    """Replace this launcher process with gunicorn (no idle parent interpreter)"""
+    os.execv(sys.executable, [
+        sys.executable, "-m", "gunicorn",
+        "-c", GUNICORN_CONFIG,
+        "--chdir", PROJECT_ROOT,
+        APP_MODULE
+    ])
+
+def run_dev_server(port: int):
+    """Run the service on the Flask development server"""
+    from python_connectors.simple_api_service import app
+
+    logger.warning("gunicorn not installed - falling back to Flask development server")
+    app.run(host='0.0.0.0', port=port, debug=False)
+
 if __name__ == '__main__':
-    port = 5002
+    port = int(os.getenv('CONNECTOR_SERVICE_PORT', '5002'))
     logger.info(f"Starting Simplified Python Connector API service on port {port}")
     logger.info("This version runs without pandas/snowflake dependencies")
     logger.info("Available endpoints:")
@@ -31,5 +52,8 @@ if __name__ == '__main__':
     logger.info("  GET  /connectors/<company_id>/<type>/status - Get status")
     logger.info("  DELETE /connectors/<company_id>/<type> - Remove connector")
     logger.info("  POST /connectors/<company_id>/sync-all - Sync all connectors")
-    
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+
+    if importlib.util.find_spec("gunicorn") is not None:
+        run_gunicorn()
+    else:
+        run_dev_server(port)
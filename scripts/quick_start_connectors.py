@@ -25,6 +25,27 @@ def install_dependencies():
         print("⚠️  requirements_simple_connectors.txt not found, continuing anyway...")
         return True
 
+def wait_for_service(process, url="http://localhost:5002/health", timeout=30):
+    """Poll the health endpoint with exponential backoff until the service answers"""
+    delay = 0.1
+    deadline = time.monotonic() + timeout
+    
+    while time.monotonic() < deadline:
+        # Stop waiting as soon as the service process has exited
+        if process.poll() is not None:
+            return False
+        
+        try:
+            if requests.get(url, timeout=2).status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+    
+    return False
+
 def start_connector_service():
     """Start the Python connector service"""
     print("🚀 Starting Python Connector Service on port 5002...")
@@ -33,39 +54,29 @@ def start_connector_service():
         # Start the simplified service (no pandas dependency)
         process = subprocess.Popen([sys.executable, "python_services/start_simple_connector_service.py"])
         
-        # Wait a bit for service to start
+        # Wait until the health endpoint answers instead of guessing a delay
         print("⏳ Waiting for service to start...")
-        time.sleep(3)
-        
-        # Check if service is running
-        try:
-            response = requests.get("http://localhost:5002/health", timeout=5)
-            if response.status_code == 200:
-                print("✅ Python Connector Service is running!")
-                print("🔗 Health check: http://localhost:5002/health")
-                print("📋 Available connectors: http://localhost:5002/connectors/available")
-                print("")
-                print("🎯 The service is now ready to handle connector requests!")
-                print("   You can now create connectors through your app's setup page.")
-                print("")
-                print("🛑 Press Ctrl+C to stop the service")
-                
-                # Keep the service running
-                try:
-                    process.wait()
-                except KeyboardInterrupt:
-                    print("\n🛑 Stopping Python Connector Service...")
-                    process.terminate()
-                    process.wait()
-                    print("✅ Service stopped")
-                    
-                return True
-            else:
-                print(f"❌ Service health check failed: {response.status_code}")
+        if wait_for_service(process):
+            print("✅ Python Connector Service is running!")
+            print("🔗 Health check: http://localhost:5002/health")
+            print("📋 Available connectors: http://localhost:5002/connectors/available")
+            print("")
+            print("🎯 The service is now ready to handle connector requests!")
+            print("   You can now create connectors through your app's setup page.")
+            print("")
+            print("🛑 Press Ctrl+C to stop the service")
+            
+            # Keep the service running
+            try:
+                process.wait()
+            except KeyboardInterrupt:
+                print("\n🛑 Stopping Python Connector Service...")
                 process.terminate()
-                return False
+                process.wait()
+                print("✅ Service stopped")
                 
-        except requests.exceptions.ConnectionError:
+            return True
+        else:
             print("❌ Could not connect to service on port 5002")
             print("   Make sure no other service is using this port")
             process.terminate()
@@ -25,14 +25,46 @@ For full testing with real data, use the OAuth flow through the web interface.
 import os
 import sys
 import json
+import re
+import atexit
+import functools
 import psycopg2
+from psycopg2.extras import execute_values
 import requests
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+# orjson encodes the mock records in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the parent directory to sys.path to import from server modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Expected shape of the generated authorization URL, checked in one pass
+AUTH_URL_PATTERN = re.compile(
+    r"^https://login\.mailchimp\.com/oauth2/authorize\?"
+    r"response_type=code&client_id=(?P<client_id>[^&]*)&redirect_uri=[^&]+&state="
+)
+
+
+def to_json(value: Any) -> str:
+    """Serialize a mock record to a JSON string for the data column."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value)
+
+
+@functools.lru_cache(maxsize=1)
+def get_connection(database_url: str):
+    """Open one database connection and share it across all smoke tests."""
+    conn = psycopg2.connect(database_url)
+    atexit.register(conn.close)
+    return conn
+
 
 class MailchimpSmokeTest:
     def __init__(self):
@@ -247,11 +279,8 @@ class MailchimpSmokeTest:
             print(f"   Generated URL: {auth_url[:80]}...")
 
             # Validate URL components
-            assert 'login.mailchimp.com' in auth_url
-            assert 'response_type=code' in auth_url
-            assert f'client_id={self.client_id}' in auth_url
-            assert 'redirect_uri' in auth_url
-            assert 'state=' in auth_url
+            match = AUTH_URL_PATTERN.search(auth_url)
+            assert match and match.group('client_id') == self.client_id
 
             print("✅ OAuth URL generation successful")
             self.test_results['oauth_url'] = True
@@ -267,7 +296,7 @@ class MailchimpSmokeTest:
         print("🗄️  Testing database connection...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             # Test connection
@@ -276,7 +305,6 @@ class MailchimpSmokeTest:
             print(f"   Connected to: {version[0][:50]}...")
 
             cursor.close()
-            conn.close()
 
             print("✅ Database connection successful")
             self.test_results['database'] = True
@@ -292,50 +320,44 @@ class MailchimpSmokeTest:
         print("📊 Testing schema creation...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
 
-            # Create schema
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-
-            # Test raw table creation
+            # Create the schema and all raw tables in a single round trip
             cursor.execute(f"""
+                CREATE SCHEMA IF NOT EXISTS {schema_name};
+
                 CREATE TABLE IF NOT EXISTS {schema_name}.raw_mailchimp_lists (
                     id SERIAL PRIMARY KEY,
                     data JSONB NOT NULL,
                     source_system TEXT NOT NULL,
                     company_id BIGINT NOT NULL,
                     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+                );
 
-            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS {schema_name}.raw_mailchimp_list_members (
                     id SERIAL PRIMARY KEY,
                     data JSONB NOT NULL,
                     source_system TEXT NOT NULL,
                     company_id BIGINT NOT NULL,
                     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+                );
 
-            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS {schema_name}.raw_mailchimp_campaigns (
                     id SERIAL PRIMARY KEY,
                     data JSONB NOT NULL,
                     source_system TEXT NOT NULL,
                     company_id BIGINT NOT NULL,
                     loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+                );
             """)
 
             conn.commit()
             print(f"   Schema '{schema_name}' created/verified")
 
             cursor.close()
-            conn.close()
 
             print("✅ Schema creation successful")
             self.test_results['schema'] = True
@@ -351,56 +373,44 @@ class MailchimpSmokeTest:
         print("📥 Testing data insertion...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
 
-            # Clear existing test data
-            cursor.execute(f"DELETE FROM {schema_name}.raw_mailchimp_lists WHERE source_system = 'mailchimp_smoke_test'")
-            cursor.execute(f"DELETE FROM {schema_name}.raw_mailchimp_list_members WHERE source_system = 'mailchimp_smoke_test'")
-            cursor.execute(f"DELETE FROM {schema_name}.raw_mailchimp_campaigns WHERE source_system = 'mailchimp_smoke_test'")
-
-            # Insert mock lists
-            for list_data in self.mock_lists:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_mailchimp_lists
-                    (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(list_data), 'mailchimp_smoke_test', self.test_company_id))
-
-            # Insert mock members
-            for member_data in self.mock_members:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_mailchimp_list_members
-                    (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(member_data), 'mailchimp_smoke_test', self.test_company_id))
+            # Clear existing test data (one round trip)
+            cursor.execute(f"""
+                DELETE FROM {schema_name}.raw_mailchimp_lists WHERE source_system = 'mailchimp_smoke_test';
+                DELETE FROM {schema_name}.raw_mailchimp_list_members WHERE source_system = 'mailchimp_smoke_test';
+                DELETE FROM {schema_name}.raw_mailchimp_campaigns WHERE source_system = 'mailchimp_smoke_test';
+            """)
 
-            # Insert mock campaigns
-            for campaign_data in self.mock_campaigns:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_mailchimp_campaigns
+            # Insert mock lists, members and campaigns (one multi-row INSERT per table)
+            for table_name, records in (
+                ('raw_mailchimp_lists', self.mock_lists),
+                ('raw_mailchimp_list_members', self.mock_members),
+                ('raw_mailchimp_campaigns', self.mock_campaigns),
+            ):
+                execute_values(cursor, f"""
+                    INSERT INTO {schema_name}.{table_name}
                     (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(campaign_data), 'mailchimp_smoke_test', self.test_company_id))
+                    VALUES %s
+                """, [(to_json(record), 'mailchimp_smoke_test', self.test_company_id) for record in records])
 
             conn.commit()
 
-            # Verify insertion
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_lists WHERE source_system = 'mailchimp_smoke_test'")
-            list_count = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_list_members WHERE source_system = 'mailchimp_smoke_test'")
-            member_count = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_campaigns WHERE source_system = 'mailchimp_smoke_test'")
-            campaign_count = cursor.fetchone()[0]
+            # Verify insertion (all table counts in a single round trip)
+            cursor.execute(f"""
+                SELECT
+                  (SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_lists WHERE source_system = 'mailchimp_smoke_test'),
+                  (SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_list_members WHERE source_system = 'mailchimp_smoke_test'),
+                  (SELECT COUNT(*) FROM {schema_name}.raw_mailchimp_campaigns WHERE source_system = 'mailchimp_smoke_test')
+            """)
+            list_count, member_count, campaign_count = cursor.fetchone()
 
             print(f"   Inserted {list_count} lists, {member_count} members, {campaign_count} campaigns")
 
             cursor.close()
-            conn.close()
 
             print("✅ Data insertion successful")
             self.test_results['data_insertion'] = {
@@ -420,7 +430,7 @@ class MailchimpSmokeTest:
         print("🔄 Testing data transformations...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
@@ -567,20 +577,19 @@ class MailchimpSmokeTest:
 
             conn.commit()
 
-            # Verify transformations
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_mailchimp_lists")
-            lists_transformed = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_mailchimp_contacts")
-            contacts_transformed = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_mailchimp_activities")
-            activities_transformed = cursor.fetchone()[0]
+            # Verify transformations (one statement for all core views)
+            cursor.execute(f"""
+                WITH lists AS (SELECT COUNT(*) AS n FROM {schema_name}.core_mailchimp_lists),
+                     contacts AS (SELECT COUNT(*) AS n FROM {schema_name}.core_mailchimp_contacts),
+                     activities AS (SELECT COUNT(*) AS n FROM {schema_name}.core_mailchimp_activities)
+                SELECT lists.n, contacts.n, activities.n
+                FROM lists CROSS JOIN contacts CROSS JOIN activities
+            """)
+            lists_transformed, contacts_transformed, activities_transformed = cursor.fetchone()
 
             print(f"   Transformed {lists_transformed} lists, {contacts_transformed} contacts, {activities_transformed} activities")
 
             cursor.close()
-            conn.close()
 
             print("✅ Data transformations successful")
             self.test_results['transformations'] = {
@@ -600,7 +609,7 @@ class MailchimpSmokeTest:
         print("🧹 Cleaning up test data...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
@@ -623,7 +632,6 @@ class MailchimpSmokeTest:
 
             conn.commit()
             cursor.close()
-            conn.close()
 
             print("✅ Cleanup successful")
             self.test_results['cleanup'] = True
@@ -671,11 +679,11 @@ class MailchimpSmokeTest:
             sys.exit(1)
 
         print("\n📊 Test Summary:")
-        for key, value in self.test_results.items():
-            if isinstance(value, dict):
-                print(f"   {key}: {json.dumps(value, indent=4)}")
-            else:
-                print(f"   {key}: {'✅ PASS' if value else '❌ FAIL'}")
+        sys.stdout.write(''.join(
+            f"   {key}: {json.dumps(value, indent=4)}\n" if isinstance(value, dict)
+            else f"   {key}: {'✅ PASS' if value else '❌ FAIL'}\n"
+            for key, value in self.test_results.items()
+        ))
 
 
 if __name__ == '__main__':
@@ -25,14 +25,47 @@ For full testing with real data, use the OAuth flow through the web interface.
 import os
 import sys
 import json
+import re
+import atexit
+import functools
 import psycopg2
+from psycopg2.extras import execute_values
 import requests
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+# orjson encodes the mock records in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the parent directory to sys.path to import from server modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Expected shape of the generated authorization URL, checked in one pass
+AUTH_URL_PATTERN = re.compile(
+    r"^https://auth\.monday\.com/oauth2/authorize\?"
+    r"client_id=(?P<client_id>[^&]*)&redirect_uri=[^&]+&state=[^&]+&"
+    r"scope=[^&]*boards(?::|%3A)read"
+)
+
+
+def to_json(value: Any) -> str:
+    """Serialize a mock record to a JSON string for the data column."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value)
+
+
+@functools.lru_cache(maxsize=1)
+def get_connection(database_url: str):
+    """Open one database connection and share it across all smoke tests."""
+    conn = psycopg2.connect(database_url)
+    atexit.register(conn.close)
+    return conn
+
 
 class MondaySmokeTest:
     def __init__(self):
@@ -371,12 +404,8 @@ class MondaySmokeTest:
             print(f"   Generated URL: {auth_url[:80]}...")
 
             # Validate URL components
-            assert 'auth.monday.com' in auth_url
-            assert f'client_id={self.client_id}' in auth_url
-            assert 'redirect_uri' in auth_url
-            assert 'state=' in auth_url
-            assert 'scope=' in auth_url
-            assert 'boards%3Aread' in auth_url or 'boards:read' in auth_url
+            match = AUTH_URL_PATTERN.search(auth_url)
+            assert match and match.group('client_id') == self.client_id
 
             print("✅ OAuth URL generation successful")
             self.test_results['oauth_url'] = True
@@ -485,7 +514,7 @@ class MondaySmokeTest:
         print("🗄️  Testing database connection...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             # Test connection
@@ -494,7 +523,6 @@ class MondaySmokeTest:
             print(f"   Connected to: {version[0][:50]}...")
 
             cursor.close()
-            conn.close()
 
             print("✅ Database connection successful")
             self.test_results['database'] = True
@@ -510,14 +538,11 @@ class MondaySmokeTest:
         print("📊 Testing schema creation...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
 
-            # Create schema
-            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
-
             # Test raw table creation
             tables = [
                 'raw_monday_boards',
@@ -526,22 +551,21 @@ class MondaySmokeTest:
                 'raw_monday_updates'
             ]
 
-            for table_name in tables:
-                cursor.execute(f"""
+            # Create the schema and every raw table in a single round trip
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name};" + "".join(f"""
                     CREATE TABLE IF NOT EXISTS {schema_name}.{table_name} (
                         id SERIAL PRIMARY KEY,
                         data JSONB NOT NULL,
                         source_system TEXT NOT NULL,
                         company_id BIGINT NOT NULL,
                         loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
+                    );
+                """ for table_name in tables))
 
             conn.commit()
             print(f"   Schema '{schema_name}' created/verified with {len(tables)} tables")
 
             cursor.close()
-            conn.close()
 
             print("✅ Schema creation successful")
             self.test_results['schema'] = True
@@ -557,68 +581,47 @@ class MondaySmokeTest:
         print("📥 Testing data insertion...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
 
-            # Clear existing test data
-            cursor.execute(f"DELETE FROM {schema_name}.raw_monday_boards WHERE source_system = 'monday_smoke_test'")
-            cursor.execute(f"DELETE FROM {schema_name}.raw_monday_users WHERE source_system = 'monday_smoke_test'")
-            cursor.execute(f"DELETE FROM {schema_name}.raw_monday_items WHERE source_system = 'monday_smoke_test'")
-            cursor.execute(f"DELETE FROM {schema_name}.raw_monday_updates WHERE source_system = 'monday_smoke_test'")
-
-            # Insert mock boards
-            for board_data in self.mock_boards:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_monday_boards
-                    (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(board_data), 'monday_smoke_test', self.test_company_id))
-
-            # Insert mock users
-            for user_data in self.mock_users:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_monday_users
-                    (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(user_data), 'monday_smoke_test', self.test_company_id))
-
-            # Insert mock items
-            for item_data in self.mock_items:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_monday_items
-                    (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(item_data), 'monday_smoke_test', self.test_company_id))
+            # Clear existing test data (one round trip)
+            cursor.execute(f"""
+                DELETE FROM {schema_name}.raw_monday_boards WHERE source_system = 'monday_smoke_test';
+                DELETE FROM {schema_name}.raw_monday_users WHERE source_system = 'monday_smoke_test';
+                DELETE FROM {schema_name}.raw_monday_items WHERE source_system = 'monday_smoke_test';
+                DELETE FROM {schema_name}.raw_monday_updates WHERE source_system = 'monday_smoke_test';
+            """)
 
-            # Insert mock updates
-            for update_data in self.mock_updates:
-                cursor.execute(f"""
-                    INSERT INTO {schema_name}.raw_monday_updates
+            # Insert mock boards, users, items and updates (one multi-row INSERT per table)
+            for table_name, records in (
+                ('raw_monday_boards', self.mock_boards),
+                ('raw_monday_users', self.mock_users),
+                ('raw_monday_items', self.mock_items),
+                ('raw_monday_updates', self.mock_updates),
+            ):
+                execute_values(cursor, f"""
+                    INSERT INTO {schema_name}.{table_name}
                     (data, source_system, company_id)
-                    VALUES (%s, %s, %s)
-                """, (json.dumps(update_data), 'monday_smoke_test', self.test_company_id))
+                    VALUES %s
+                """, [(to_json(record), 'monday_smoke_test', self.test_company_id) for record in records])
 
             conn.commit()
 
-            # Verify insertion
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_monday_boards WHERE source_system = 'monday_smoke_test'")
-            board_count = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_monday_users WHERE source_system = 'monday_smoke_test'")
-            user_count = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_monday_items WHERE source_system = 'monday_smoke_test'")
-            item_count = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.raw_monday_updates WHERE source_system = 'monday_smoke_test'")
-            update_count = cursor.fetchone()[0]
+            # Verify insertion (all table counts in a single round trip)
+            cursor.execute(f"""
+                SELECT
+                  (SELECT COUNT(*) FROM {schema_name}.raw_monday_boards WHERE source_system = 'monday_smoke_test'),
+                  (SELECT COUNT(*) FROM {schema_name}.raw_monday_users WHERE source_system = 'monday_smoke_test'),
+                  (SELECT COUNT(*) FROM {schema_name}.raw_monday_items WHERE source_system = 'monday_smoke_test'),
+                  (SELECT COUNT(*) FROM {schema_name}.raw_monday_updates WHERE source_system = 'monday_smoke_test')
+            """)
+            board_count, user_count, item_count, update_count = cursor.fetchone()
 
             print(f"   Inserted {board_count} boards, {user_count} users, {item_count} items, {update_count} updates")
 
             cursor.close()
-            conn.close()
 
             print("✅ Data insertion successful")
             self.test_results['data_insertion'] = {
@@ -639,7 +642,7 @@ class MondaySmokeTest:
         print("🔄 Testing data transformations...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
@@ -816,23 +819,20 @@ class MondaySmokeTest:
 
             conn.commit()
 
-            # Verify transformations
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_monday_companies")
-            companies_transformed = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_monday_contacts")
-            contacts_transformed = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_monday_deals")
-            deals_transformed = cursor.fetchone()[0]
-
-            cursor.execute(f"SELECT COUNT(*) FROM {schema_name}.core_monday_activities")
-            activities_transformed = cursor.fetchone()[0]
+            # Verify transformations (one statement for all core views)
+            cursor.execute(f"""
+                WITH companies AS (SELECT COUNT(*) AS n FROM {schema_name}.core_monday_companies),
+                     contacts AS (SELECT COUNT(*) AS n FROM {schema_name}.core_monday_contacts),
+                     deals AS (SELECT COUNT(*) AS n FROM {schema_name}.core_monday_deals),
+                     activities AS (SELECT COUNT(*) AS n FROM {schema_name}.core_monday_activities)
+                SELECT companies.n, contacts.n, deals.n, activities.n
+                FROM companies CROSS JOIN contacts CROSS JOIN deals CROSS JOIN activities
+            """)
+            companies_transformed, contacts_transformed, deals_transformed, activities_transformed = cursor.fetchone()
 
             print(f"   Transformed {companies_transformed} companies, {contacts_transformed} contacts, {deals_transformed} deals, {activities_transformed} activities")
 
             cursor.close()
-            conn.close()
 
             print("✅ Data transformations successful")
             self.test_results['transformations'] = {
@@ -853,7 +853,7 @@ class MondaySmokeTest:
         print("🧹 Cleaning up test data...")
 
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = get_connection(self.database_url)
             cursor = conn.cursor()
 
             schema_name = f"analytics_company_{self.test_company_id}"
@@ -880,7 +880,6 @@ class MondaySmokeTest:
 
             conn.commit()
             cursor.close()
-            conn.close()
 
             print("✅ Cleanup successful")
             self.test_results['cleanup'] = True
@@ -929,11 +928,11 @@ class MondaySmokeTest:
             sys.exit(1)
 
         print("\n📊 Test Summary:")
-        for key, value in self.test_results.items():
-            if isinstance(value, dict):
-                print(f"   {key}: {json.dumps(value, indent=4)}")
-            else:
-                print(f"   {key}: {'✅ PASS' if value else '❌ FAIL'}")
+        sys.stdout.write(''.join(
+            f"   {key}: {json.dumps(value, indent=4)}\n" if isinstance(value, dict)
+            else f"   {key}: {'✅ PASS' if value else '❌ FAIL'}\n"
+            for key, value in self.test_results.items()
+        ))
 
 
 if __name__ == '__main__':
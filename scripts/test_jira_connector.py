@@ -7,6 +7,8 @@ This script demonstrates how to use the Jira connector with example credentials.
 import sys
 import os
 import json
+import io
+import contextlib
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -53,7 +55,7 @@ def test_jira_connector_manager():
     
     try:
         # Check if Jira is in available connectors
-        available = simple_connector_manager.get_available_connectors()
+        available = frozenset(simple_connector_manager.get_available_connectors())
         if "jira" not in available:
             print("✗ Jira not found in available connectors")
             return False
@@ -159,6 +161,16 @@ To use the Jira connector with real data, you need:
    - etc.
 """)
 
+def run_buffered(test_func):
+    """Run a test with its output collected and written to stdout in one call"""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return test_func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 def main():
     """Run Jira connector tests"""
     print("="*60)
@@ -178,7 +190,7 @@ def main():
         print(f"{'-'*40}")
         
         try:
-            results[test_name] = test_func()
+            results[test_name] = run_buffered(test_func)
         except Exception as e:
             print(f"✗ {test_name} failed with exception: {str(e)}")
             results[test_name] = False
@@ -194,9 +206,10 @@ def main():
     passed = sum(1 for result in results.values() if result)
     total = len(results)
     
-    for test_name, result in results.items():
-        status = "✓ PASSED" if result else "✗ FAILED"
-        print(f"{test_name:<30} {status}")
+    sys.stdout.write(''.join(
+        f"{test_name:<30} {'✓ PASSED' if result else '✗ FAILED'}\n"
+        for test_name, result in results.items()
+    ))
     
     print(f"\nOverall: {passed}/{total} tests passed")
     
@@ -7,6 +7,8 @@ This script tests the basic functionality of the connector system without requir
 import sys
 import os
 import json
+import io
+import contextlib
 import requests
 import time
 from datetime import datetime
@@ -155,6 +157,16 @@ def test_postgres_dependencies():
         print("  Run: pip install -r requirements_simple_connectors.txt")
         return False
 
+def run_buffered(test_func):
+    """Run a test with its output collected and written to stdout in one call"""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return test_func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -176,7 +188,7 @@ def main():
         print(f"{'=' * 40}")
         
         try:
-            results[test_name] = test_func()
+            results[test_name] = run_buffered(test_func)
         except Exception as e:
             print(f"✗ {test_name} tests failed with exception: {str(e)}")
             results[test_name] = False
@@ -186,14 +198,13 @@ def main():
     print("Test Summary")
     print(f"{'=' * 60}")
     
-    passed = 0
+    passed = sum(1 for result in results.values() if result)
     total = len(results)
     
-    for test_name, result in results.items():
-        status = "✓ PASSED" if result else "✗ FAILED"
-        print(f"{test_name:<25} {status}")
-        if result:
-            passed += 1
+    sys.stdout.write(''.join(
+        f"{test_name:<25} {'✓ PASSED' if result else '✗ FAILED'}\n"
+        for test_name, result in results.items()
+    ))
     
     print(f"\nOverall: {passed}/{total} tests passed")
     
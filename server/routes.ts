@@ -46,6 +46,10 @@ import { emailService } from "./services/email-service";
 import bcrypt from "bcryptjs";
 
 
+// Public URLs used to build OAuth redirects and emailed links, read once at startup
+const FRONTEND_URL = process.env.FRONTEND_URL || 'http://localhost:5000';
+const APP_URL = process.env.APP_URL || 'http://localhost:5000';
+
 // File upload configuration
 const UPLOAD_FOLDER = 'uploads';
 const ALLOWED_EXTENSIONS = new Set([
@@ -429,13 +433,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
 
       // Redirect to frontend setup page with OAuth parameters
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?code=${code}&state=${state}`);
+      res.redirect(`${FRONTEND_URL}/setup?code=${code}&state=${state}`);
 
     } catch (error) {
       console.error('Jira OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -637,13 +639,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
 
       // Redirect back to frontend with success
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?hubspot=connected`);
+      res.redirect(`${FRONTEND_URL}/setup?hubspot=connected`);
       
     } catch (error) {
       console.error('HubSpot OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -854,13 +854,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
 
       // Redirect back to frontend with success
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?mailchimp=connected`);
+      res.redirect(`${FRONTEND_URL}/setup?mailchimp=connected`);
 
     } catch (error) {
       console.error('Mailchimp OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -1013,7 +1011,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         : mailchimpSource.config;
 
       // Create webhook callback URL
-      const callbackUrl = `${process.env.APP_URL || 'http://localhost:5000'}/api/webhooks/mailchimp/${companyId}/${listId}`;
+      const callbackUrl = `${APP_URL}/api/webhooks/mailchimp/${companyId}/${listId}`;
 
       // Create webhook
       const webhook = await mailchimpOAuthService.createWebhook(
@@ -1218,13 +1216,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
 
       // Redirect back to frontend with success
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?monday=connected`);
+      res.redirect(`${FRONTEND_URL}/setup?monday=connected`);
 
     } catch (error) {
       console.error('Monday.com OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -1377,7 +1373,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         : mondaySource.config;
 
       // Create webhook callback URL
-      const callbackUrl = `${process.env.APP_URL || 'http://localhost:5000'}/api/webhooks/monday/${companyId}/${boardId}`;
+      const callbackUrl = `${APP_URL}/api/webhooks/monday/${companyId}/${boardId}`;
 
       // Create webhook
       const webhook = await mondayOAuthService.createWebhook(
@@ -1534,13 +1530,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
 
       // Redirect back to frontend with success
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?odoo=connected`);
+      res.redirect(`${FRONTEND_URL}/setup?odoo=connected`);
       
     } catch (error) {
       console.error('Odoo OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -1782,7 +1776,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       if (error) {
         console.error('Zoho OAuth error:', error);
-        return res.redirect(`${process.env.APP_URL || 'http://localhost:5000'}/setup?error=zoho_auth_denied`);
+        return res.redirect(`${APP_URL}/setup?error=zoho_auth_denied`);
       }
 
       if (!code || !state) {
@@ -1833,10 +1827,10 @@ export async function registerRoutes(app: Express): Promise<Server> {
       console.log(`✅ Zoho OAuth connection established for company ${companyId}`);
       
       // Redirect back to setup page with success
-      res.redirect(`${process.env.APP_URL || 'http://localhost:5000'}/setup?zoho=connected`);
+      res.redirect(`${APP_URL}/setup?zoho=connected`);
     } catch (error) {
       console.error('Zoho OAuth callback error:', error);
-      res.redirect(`${process.env.APP_URL || 'http://localhost:5000'}/setup?error=zoho_auth_failed`);
+      res.redirect(`${APP_URL}/setup?error=zoho_auth_failed`);
     }
   });
 
@@ -1976,15 +1970,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
   app.get("/api/auth/asana/callback", async (req, res) => {
     try {
       const { code, state, error } = req.query;
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
       
       if (error) {
         console.error('Asana OAuth error:', error);
-        return res.redirect(`${frontendUrl}/setup?error=asana_auth_denied`);
+        return res.redirect(`${FRONTEND_URL}/setup?error=asana_auth_denied`);
       }
       
       if (!code || !state) {
-        return res.redirect(`${frontendUrl}/setup?error=missing_params`);
+        return res.redirect(`${FRONTEND_URL}/setup?error=missing_params`);
       }
       
       // Parse state to get company context
@@ -2033,12 +2026,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
       console.log(`✅ Asana OAuth connection established for company ${companyId}`);
       
       // Redirect back to setup page with success
-      res.redirect(`${frontendUrl}/setup?asana=connected`);
+      res.redirect(`${FRONTEND_URL}/setup?asana=connected`);
       
     } catch (error) {
       console.error('Asana OAuth callback error:', error);
-      const frontendUrl = process.env.FRONTEND_URL || 'http://localhost:5000';
-      res.redirect(`${frontendUrl}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
+      res.redirect(`${FRONTEND_URL}/setup?error=oauth_failed&message=${encodeURIComponent(error.message)}`);
     }
   });
 
@@ -2616,7 +2608,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       const { token } = await accountSecurityService.generatePasswordResetToken(user.id);
 
       // Send password reset email
-      const resetLink = `${process.env.APP_URL || 'http://localhost:5000'}/reset-password?token=${token}`;
+      const resetLink = `${APP_URL}/reset-password?token=${token}`;
 
       const emailSent = await emailService.sendPasswordResetEmail(email, {
         firstName: user.firstName || user.username,
@@ -3127,7 +3119,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       // Send welcome email to new admin
       try {
-        const loginLink = `${process.env.APP_URL || 'http://localhost:5000'}/login`;
+        const loginLink = `${APP_URL}/login`;
         await emailService.sendUserCreatedEmail(email, {
           firstName,
           lastName,
@@ -3248,7 +3240,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       // Send welcome email to new user
       try {
-        const loginLink = `${process.env.APP_URL || 'http://localhost:5000'}/login`;
+        const loginLink = `${APP_URL}/login`;
         await emailService.sendUserCreatedEmail(email, {
           firstName,
           lastName,
@@ -4925,6 +4917,27 @@ Convert the user request into the appropriate filter structure:
     }
   });
 
+  // Start the SQL-backed metric calculations for a report up front so the
+  // queries run concurrently; callers await each promise in report order
+  const startReportMetricCalculations = (metricIds: number[], metricsMap: Map<number, any>, companyId: number, timePeriod: string) => {
+    const pending = new Map<number, ReturnType<typeof postgresAnalyticsService.calculateMetric>>();
+    for (const metricId of metricIds) {
+      const metric = metricsMap.get(metricId);
+      if (!metric?.exprSql || pending.has(metric.id)) continue;
+      const calculation = postgresAnalyticsService.calculateMetric(
+        metric.name,
+        companyId,
+        timePeriod,
+        metric.id,
+        metric.exprSql
+      );
+      // Rejections surface when the caller awaits; avoid unhandled-rejection crashes meanwhile
+      calculation.catch(() => {});
+      pending.set(metric.id, calculation);
+    }
+    return pending;
+  };
+
   // Generate report data with real metric calculations
   app.get("/api/metric-reports/:id/data", async (req, res) => {
     console.log("🚨 ROUTE HIT: /api/metric-reports/:id/data");
@@ -4961,8 +4974,11 @@ Convert the user request into the appropriate filter structure:
         }
       };
       
+      const selectedMetricIds = report.selectedMetrics as number[] || [];
+      const pendingCalculations = startReportMetricCalculations(selectedMetricIds, metricsMap, companyId, timePeriod);
+      
       // Process each selected metric
-      for (const metricId of (report.selectedMetrics as number[] || [])) {
+      for (const metricId of selectedMetricIds) {
         const metric = metricsMap.get(metricId);
         if (!metric) {
           console.log(`Metric ${metricId} not found, skipping`);
@@ -4989,13 +5005,7 @@ Convert the user request into the appropriate filter structure:
         // Calculate real metric value if SQL query exists
         if (metric.exprSql) {
           try {
-            const result = await postgresAnalyticsService.calculateMetric(
-              metric.name,
-              companyId,
-              timePeriod,
-              metric.id,
-              metric.exprSql
-            );
+            const result = await pendingCalculations.get(metric.id);
             
             if (result) {
               metricData.currentValue = result.currentValue;
@@ -5166,8 +5176,11 @@ Annual forecast: ${yearlyProjection.toLocaleString()}. ${progress > 50 ? 'Expect
         }
       };
 
+      const selectedMetricIds = report.selectedMetrics as number[] || [];
+      const pendingCalculations = startReportMetricCalculations(selectedMetricIds, metricsMap, companyId, timePeriod);
+
       // Process each selected metric (reuse logic from data endpoint)
-      for (const metricId of (report.selectedMetrics as number[] || [])) {
+      for (const metricId of selectedMetricIds) {
         const metric = metricsMap.get(metricId);
         if (!metric) continue;
 
@@ -5191,13 +5204,7 @@ Annual forecast: ${yearlyProjection.toLocaleString()}. ${progress > 50 ? 'Expect
         // Calculate real metric value if SQL query exists
         if (metric.exprSql) {
           try {
-            const result = await postgresAnalyticsService.calculateMetric(
-              metric.name,
-              companyId,
-              timePeriod,
-              metric.id,
-              metric.exprSql
-            );
+            const result = await pendingCalculations.get(metric.id);
 
             if (result) {
               metricData.currentValue = result.currentValue;
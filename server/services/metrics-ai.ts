@@ -81,24 +81,20 @@ export class MetricsAIService {
   async getSchemaInfoForCompany(companyId: number): Promise<SchemaInfo> {
     try {
       console.log(`🔄 Starting PostgreSQL schema discovery for company ${companyId}...`);
-      const tables = await postgresAnalytics.getAvailableTables(companyId);
+      // One projected query for every table's columns (instead of a table
+      // listing plus two metadata queries per table)
+      const tables = await postgresAnalytics.getTableColumns(companyId);
       
       if (tables.length > 0) {
         console.log(`✅ Successfully discovered ${tables.length} tables for company ${companyId}`);
         
-        // Get detailed schema info for each table
-        const tableSchemas = await Promise.all(
-          tables.map(async (tableName) => {
-            const columns = await postgresAnalytics.getTableSchema(tableName, companyId);
-            return {
-              name: tableName,
-              columns: columns.map(col => ({
-                name: col.column_name,
-                type: col.data_type.toUpperCase()
-              }))
-            };
-          })
-        );
+        const tableSchemas = tables.map(table => ({
+          name: table.name,
+          columns: table.columns.map(col => ({
+            name: col.name,
+            type: col.type.toUpperCase()
+          }))
+        }));
         
         return { tables: tableSchemas };
       }
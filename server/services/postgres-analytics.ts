@@ -170,12 +170,8 @@ export class PostgresAnalyticsService {
         ${getTimeFilter('closedate')}
       `,
       'Annual Profit': `
-        SELECT COALESCE(SUM(amount), 0) - COALESCE(
-          (SELECT SUM(CASE WHEN amount > 0 THEN amount * 0.3 ELSE 0 END) 
-           FROM ${schema}.salesforce_opportunity 
-           WHERE stagename = 'Closed Won' 
-           ${getTimeFilter('closedate')}), 0
-        ) as metric_value 
+        SELECT COALESCE(SUM(amount), 0)
+          - COALESCE(SUM(CASE WHEN amount > 0 THEN amount * 0.3 ELSE 0 END), 0) as metric_value
         FROM ${schema}.salesforce_opportunity 
         WHERE stagename = 'Closed Won' 
         ${getTimeFilter('closedate')}
@@ -547,6 +543,46 @@ export class PostgresAnalyticsService {
     }
   }
 
+  /**
+   * Get column names and types for every table in the company's schema in one query
+   */
+  async getTableColumns(companyId: number): Promise<Array<{ name: string; columns: Array<{ name: string; type: string }> }>> {
+    try {
+      const schema = this.getAnalyticsSchemaName(companyId);
+      
+      // Project only what schema discovery needs, for all tables at once
+      // (STRICT TENANT ISOLATION: only this company's schema)
+      const query = `
+        SELECT table_name, column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = '${schema}'
+        ORDER BY table_name, ordinal_position
+      `;
+      
+      const result = await this.executeQuery(query);
+      if (!result.success || !result.data) {
+        return [];
+      }
+      
+      const tableMap = new Map<string, Array<{ name: string; type: string }>>();
+      for (const row of result.data) {
+        if (!tableMap.has(row.table_name)) {
+          tableMap.set(row.table_name, []);
+        }
+        tableMap.get(row.table_name)!.push({
+          name: row.column_name,
+          type: row.data_type
+        });
+      }
+      
+      return Array.from(tableMap.entries()).map(([name, columns]) => ({ name, columns }));
+    
+    } catch (error) {
+      console.error(`Error getting table columns for company ${companyId}:`, error);
+      return [];
+    }
+  }
+
   async getTableData(tableName: string, companyId: number, limit: number = 100): Promise<any[]> {
     try {
       console.log(`🔍 getTableData called: table=${tableName}, company=${companyId}, limit=${limit}`);
@@ -61,6 +61,24 @@ async function isPortInUse(port: number): Promise<boolean> {
   });
 }
 
+/**
+ * Poll a port with exponential backoff until it accepts connections
+ */
+async function waitForPort(port: number, timeoutMs: number = 15000): Promise<boolean> {
+  const deadline = Date.now() + timeoutMs;
+  let delay = 100;
+
+  while (Date.now() < deadline) {
+    if (await isPortInUse(port)) {
+      return true;
+    }
+    await new Promise(resolve => setTimeout(resolve, delay));
+    delay = Math.min(delay * 2, 2000);
+  }
+
+  return false;
+}
+
 /**
  * Start Python connector service if not already running
  */
@@ -131,10 +149,8 @@ async function startConnectorService(pythonCmd: string): Promise<boolean> {
       console.log(`[Connector Error] ${data.toString().trim()}`);
     });
 
-    // Wait a bit and check if it started
-    await new Promise(resolve => setTimeout(resolve, 3000));
-    
-    if (await isPortInUse(5002)) {
+    // Wait until the service accepts connections instead of a fixed delay
+    if (await waitForPort(5002)) {
       console.log('✅ Python Connector Service started successfully');
       return true;
     } else {
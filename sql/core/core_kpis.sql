@@ -1,11 +1,23 @@
 -- Core KPIs model aggregating key business metrics
 -- This model calculates current and historical KPI values for dashboard display
 
-WITH date_spine AS (
+-- Reporting months and calculation time, anchored to the dbt run start as
+-- literals (rather than CURRENT_DATE()/CURRENT_TIMESTAMP()) so the compiled
+-- query is deterministic for a run and eligible for the result cache
+WITH reporting_period AS (
+    SELECT
+        TIMESTAMP '{{ run_started_at.strftime("%Y-%m-%d %H:%M:%S") }}' AS calculated_at,
+        DATE '{{ run_started_at.strftime("%Y-%m-%d") }}' AS run_date,
+        DATE_TRUNC(DATE_SUB(DATE '{{ run_started_at.strftime("%Y-%m-%d") }}', INTERVAL 1 MONTH), MONTH) AS current_month,
+        DATE_TRUNC(DATE_SUB(DATE '{{ run_started_at.strftime("%Y-%m-%d") }}', INTERVAL 2 MONTH), MONTH) AS prev_month,
+        DATE_TRUNC(DATE_SUB(DATE '{{ run_started_at.strftime("%Y-%m-%d") }}', INTERVAL 13 MONTH), MONTH) AS yoy_month
+),
+
+date_spine AS (
     SELECT date_month
     FROM (
-        SELECT DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL n MONTH), MONTH) AS date_month
-        FROM UNNEST(GENERATE_ARRAY(0, 23)) AS n  -- Last 24 months
+        SELECT DATE_TRUNC(DATE_SUB(rp.run_date, INTERVAL n MONTH), MONTH) AS date_month
+        FROM reporting_period rp, UNNEST(GENERATE_ARRAY(0, 23)) AS n  -- Last 24 months
     )
     WHERE date_month >= '2020-01-01'  -- Reasonable start date
 ),
@@ -141,37 +153,41 @@ enhanced_monthly_kpis AS (
 -- Calculate current month and comparison periods
 current_metrics AS (
     SELECT 
-        -- Current month (most recent complete month)
-        DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) AS current_month,
+        -- Current month (most recent complete month); read through a scalar
+        -- subquery so this stays an ungrouped aggregate that always returns
+        -- one row, even when no KPI rows exist yet
+        (SELECT current_month FROM reporting_period) AS current_month,
+        (SELECT calculated_at FROM reporting_period) AS calculated_at,
         
         -- Get metrics for current month
-        SUM(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) 
+        SUM(CASE WHEN month = rp.current_month 
                  THEN monthly_revenue ELSE 0 END) AS current_monthly_revenue,
         
-        SUM(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) 
+        SUM(CASE WHEN month = rp.current_month 
                  THEN active_customers ELSE 0 END) AS current_active_customers,
         
-        AVG(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) 
+        AVG(CASE WHEN month = rp.current_month 
                  THEN retention_rate_3m END) AS current_retention_rate,
         
-        AVG(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) 
+        AVG(CASE WHEN month = rp.current_month 
                  THEN churn_rate_3m END) AS current_churn_rate,
         
-        AVG(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 1 MONTH), MONTH) 
+        AVG(CASE WHEN month = rp.current_month 
                  THEN avg_customer_ltv END) AS current_avg_ltv,
         
         -- Previous month for comparison
-        SUM(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 2 MONTH), MONTH) 
+        SUM(CASE WHEN month = rp.prev_month 
                  THEN monthly_revenue ELSE 0 END) AS prev_monthly_revenue,
         
-        SUM(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 2 MONTH), MONTH) 
+        SUM(CASE WHEN month = rp.prev_month 
                  THEN active_customers ELSE 0 END) AS prev_active_customers,
         
         -- Previous year for YoY comparison
-        SUM(CASE WHEN month = DATE_TRUNC(DATE_SUB(CURRENT_DATE(), INTERVAL 13 MONTH), MONTH) 
+        SUM(CASE WHEN month = rp.yoy_month 
                  THEN monthly_revenue ELSE 0 END) AS yoy_monthly_revenue
         
     FROM enhanced_monthly_kpis
+    CROSS JOIN reporting_period rp
 )
 
 -- Final KPI calculations
@@ -208,7 +224,7 @@ SELECT
     
     'revenue' AS kpi_category,
     1 AS display_order,
-    CURRENT_TIMESTAMP() AS calculated_at
+    calculated_at
 
 FROM current_metrics
 
@@ -229,7 +245,7 @@ SELECT
     NULL AS yoy_change_rate,
     'customer' AS kpi_category,
     2 AS display_order,
-    CURRENT_TIMESTAMP() AS calculated_at
+    calculated_at
 
 FROM current_metrics
 
@@ -249,7 +265,7 @@ SELECT
     NULL AS yoy_change_rate,
     'customer' AS kpi_category,
     3 AS display_order,
-    CURRENT_TIMESTAMP() AS calculated_at
+    calculated_at
 
 FROM current_metrics
 
@@ -286,7 +302,7 @@ SELECT
     
     'revenue' AS kpi_category,
     0 AS display_order,  -- Primary KPI
-    CURRENT_TIMESTAMP() AS calculated_at
+    calculated_at
 
 FROM current_metrics
 
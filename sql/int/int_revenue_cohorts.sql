@@ -17,55 +17,45 @@ WITH quickbooks_revenue AS (
         AND customer_id IS NOT NULL
 ),
 
--- Calculate first purchase date for each customer
-customer_first_purchase AS (
-    SELECT 
-        customer_id,
-        customer_name,
-        MIN(transaction_date) AS first_purchase_date,
-        DATE_TRUNC(MIN(transaction_date), MONTH) AS cohort_month,
-        SUM(recognized_revenue) AS total_lifetime_revenue,
-        COUNT(DISTINCT transaction_date) AS total_purchase_days,
-        COUNT(*) AS total_transactions
-    FROM quickbooks_revenue
-    GROUP BY customer_id, customer_name
-),
-
--- Monthly revenue by customer
+-- Monthly revenue by customer (one row per customer_id and month, so the
+-- lifetime window sums below never count a month twice)
 monthly_customer_revenue AS (
     SELECT 
         customer_id,
-        customer_name,
+        ANY_VALUE(customer_name) AS customer_name,
         DATE_TRUNC(transaction_date, MONTH) AS revenue_month,
         SUM(recognized_revenue) AS monthly_revenue,
         COUNT(*) AS monthly_transactions,
+        COUNT(DISTINCT transaction_date) AS monthly_purchase_days,
+        MIN(transaction_date) AS first_transaction_date,
         MAX(transaction_date) AS last_transaction_date
     FROM quickbooks_revenue
-    GROUP BY customer_id, customer_name, DATE_TRUNC(transaction_date, MONTH)
+    GROUP BY customer_id, DATE_TRUNC(transaction_date, MONTH)
 ),
 
 -- Calculate period numbers (months since first purchase)
+-- Lifetime metrics are window aggregates over the monthly rows, so the
+-- customer-level rollup needs no second GROUP BY and join back
 customer_monthly_periods AS (
     SELECT 
-        mcr.customer_id,
-        mcr.customer_name,
-        cfp.cohort_month,
-        cfp.first_purchase_date,
-        mcr.revenue_month,
-        mcr.monthly_revenue,
-        mcr.monthly_transactions,
+        customer_id,
+        customer_name,
+        DATE_TRUNC(MIN(first_transaction_date) OVER customer_window, MONTH) AS cohort_month,
+        MIN(first_transaction_date) OVER customer_window AS first_purchase_date,
+        revenue_month,
+        monthly_revenue,
+        monthly_transactions,
         
         -- Calculate period number (0 = acquisition month, 1 = first retention month, etc.)
-        DATE_DIFF(mcr.revenue_month, cfp.cohort_month, MONTH) AS period_number,
+        DATE_DIFF(revenue_month, MIN(revenue_month) OVER customer_window, MONTH) AS period_number,
         
         -- Customer lifetime metrics
-        cfp.total_lifetime_revenue,
-        cfp.total_purchase_days,
-        cfp.total_transactions
+        SUM(monthly_revenue) OVER customer_window AS total_lifetime_revenue,
+        SUM(monthly_purchase_days) OVER customer_window AS total_purchase_days,
+        SUM(monthly_transactions) OVER customer_window AS total_transactions
         
-    FROM monthly_customer_revenue mcr
-    JOIN customer_first_purchase cfp 
-        ON mcr.customer_id = cfp.customer_id
+    FROM monthly_customer_revenue
+    WINDOW customer_window AS (PARTITION BY customer_id)
 ),
 
 -- Cohort size and revenue metrics